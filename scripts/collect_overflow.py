@@ -3,23 +3,107 @@
 Auto-collect overflow reports after build
 
 This script:
-1. Starts a Vite dev server
+1. Serves the built app with `vite preview` (or the Vite dev server with --dev)
 2. Opens the presentation in headless browser (reusing server's Browser service)
 3. Navigates through all slides
 4. Extracts overflow reports from window object
 5. Saves to check_overflow.json
 """
 
+import argparse
 import asyncio
 import json
+import os
 import re
-import subprocess
 import sys
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from loguru import logger
 from metagpt.tools.libs.browser import Browser
+from playwright.async_api import async_playwright
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Page helpers installed once per document instead of re-sending closures per slide
+_PAGE_HELPERS_SCRIPT = '''
+window.__imagesReady = () => Array.from(document.images).every(img => img.complete);
+window.__nav = (i) => typeof window.__navigateToSlide === 'function' && window.__navigateToSlide(i);
+window.__collectAll = async ({ readyTimeoutMs }) => {
+  const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
+  // Ready once the on-screen OverflowDetector has finished a pass on this slide and its images are in
+  const isReady = (i) => !!window.__detectedSlides && window.__detectedSlides.has(i) && window.__imagesReady();
+  const failed = [];
+  const total = (window.__allSlides || []).length;
+  for (let i = 0; i < total; i++) {
+    if (i > 0 && !window.__nav(i)) {
+      failed.push(i);
+      continue;
+    }
+    const deadline = Date.now() + readyTimeoutMs;
+    while (!isReady(i) && Date.now() < deadline) await sleep(50);
+  }
+  const summary = typeof window.__generateOverflowSummary === 'function'
+    ? window.__generateOverflowSummary()
+    : window.__overflowSummary;
+  return { summary, failed };
+};
+'''
+
+# Upper bound per slide when the detection-complete signal never arrives
+# (e.g. the container size check skips detection)
+_SLIDE_READY_TIMEOUT_MS = 3000
+
+# Analytics and ad hosts aborted during collection; they cannot change slide layout.
+# Routed by URL regex so same-origin app/module requests never reach Python (and the
+# HTTP cache stays usable for them)
+_BLOCKED_URL_RE = re.compile(
+    r'^https?://([^/?#]+\.)?'
+    r'(google-analytics\.com|googletagmanager\.com|hotjar\.com|segment\.io|doubleclick\.net)'
+    r'([:/?#]|$)'
+)
+
+# Chromium flags for a throwaway layout-measurement session: no GPU, extensions,
+# sync or background traffic
+_CHROMIUM_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--no-first-run',
+    '--mute-audio',
+]
+
+PRIORITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+AI_EDITOR_INSTRUCTIONS = {
+    'workflow': [
+        '1. Read this file to understand all overflow issues',
+        '2. For each slide report, check the slideFile path',
+        '3. Read the slide file',
+        '4. Review fixSuggestions for each violation type',
+        '5. Apply the lowest-risk fix strategy first',
+        '6. Re-run: pnpm run check-overflow to verify',
+        '7. Iterate until totalViolations === 0',
+    ],
+    'priorityOrder': 'CRITICAL → HIGH → MEDIUM → LOW',
+    'maxIterations': 3,
+    'criticalNote': 'ALWAYS fix CRITICAL and HIGH priority issues. Use card removal first (saves most space).',
+}
+
+# Fixed port for `vite preview`, so the URL is known before the server starts
+_PREVIEW_PORT = 4321
+
+# Large write buffer so the report reaches disk in a few big writes
+_WRITE_BUFFER_SIZE = 1 << 20
 
 # Add MetaGPT to Python path to reuse Browser service
 metagpt_root = Path(__file__).parent.parent.parent.parent.parent
@@ -27,404 +111,576 @@ sys.path.insert(0, str(metagpt_root))
 
 
 
-def find_slide_file(slide_title: str, project_dir: Path) -> Optional[str]:
+_TITLE_RE = re.compile(rb'RegisterSlide\s*\(\s*\{[^}]*title\s*:\s*["\']([^"\']+)["\']')
+
+# slides_dir -> ({RegisterSlide title: file name}, [(file name, lowercase stem)])
+_SLIDES_CACHE: Dict[Path, Tuple[Dict[str, str], List[Tuple[str, str]]]] = {}
+_SLIDE_READ_WORKERS = 8
+
+
+def _extract_title(content: bytes) -> Optional[str]:
+    """Return the title from a RegisterSlide({ title: "xxx", ... }) decorator, if any"""
+    # The pattern is ASCII, so match raw bytes and only decode the title
+    match = _TITLE_RE.search(content)
+    if not match:
+        return None
+    try:
+        return match.group(1).decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+
+def _read_slide_file(file_path: Path) -> Tuple[str, str, Optional[str]]:
+    """Read one slide file as (file name, lowercase stem, RegisterSlide title)"""
+    try:
+        title = _extract_title(file_path.read_bytes())
+    except Exception:
+        title = None
+    return file_path.name, file_path.stem.lower(), title
+
+
+def _load_slide_files(slides_dir: Path) -> Tuple[Dict[str, str], List[Tuple[str, str]]]:
     """
-    Find slide file path based on slide title
-    Supports Chinese/English mixed titles by reading RegisterSlide decorators
+    Read every slide file once per directory and keep only what matching needs:
+    a RegisterSlide title index and the lowercase stems for keyword scoring
     """
-    slides_dir = project_dir / "src" / "pages" / "slides"
-    if not slides_dir.exists():
-        return None
+    cached = _SLIDES_CACHE.get(slides_dir)
+    if cached is not None:
+        return cached
     
-    # Strategy 1: Read files and match RegisterSlide title
-    for file_path in slides_dir.glob("*.tsx"):
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            # Extract title from RegisterSlide({ title: "xxx", ... })
-            match = re.search(r'RegisterSlide\s*\(\s*\{[^}]*title\s*:\s*["\']([^"\']+)["\']', content)
-            if match and match.group(1) == slide_title:
-                return f"src/pages/slides/{file_path.name}"
-        except Exception:
-            continue
+    # File reads release the GIL, so a small pool overlaps them on cold caches
+    with ThreadPoolExecutor(max_workers=_SLIDE_READ_WORKERS) as executor:
+        entries = list(executor.map(_read_slide_file, slides_dir.glob("*.tsx")))
     
-    # Strategy 2: Extract English part and do keyword matching (fallback)
+    title_index: Dict[str, str] = {}
+    for name, _, title in entries:
+        if title is not None:
+            title_index.setdefault(title, name)
+    
+    cached = _SLIDES_CACHE[slides_dir] = (title_index, [(name, stem) for name, stem, _ in entries])
+    return cached
+
+
+def _title_keywords(slide_title: str) -> Tuple[str, List[str]]:
+    """Extract the English part of a title as (compact form, keywords)"""
     english_part = re.sub(r'[^\x00-\x7F]+', ' ', slide_title).strip()
     normalized = re.sub(r'[^a-zA-Z0-9\s]', ' ', english_part).strip().lower()
     keywords = [w for w in normalized.split() if len(w) > 2]
+    return normalized.replace(' ', ''), keywords
+
+
+def _keyword_score(filename: str, normalized_compact: str, keywords: List[str]) -> float:
+    """Score a lowercase file stem against title keywords; exact matches score infinity"""
+    # Exact match
+    if normalized_compact and (filename.replace('slide', '') == normalized_compact or filename == normalized_compact):
+        return float('inf')
     
-    if not keywords:
-        return None
+    # Keyword matching with scoring
+    score = sum(len(keyword) for keyword in keywords if keyword in filename)
     
-    # Try to match files with scoring system
-    best_match = None
-    best_score = 0
+    # Check common slide name patterns
+    title_pattern = ''.join(w.capitalize() for w in keywords)
+    if title_pattern.lower() in filename:
+        score += len(title_pattern) * 2
     
-    for file_path in slides_dir.glob("*.tsx"):
-        filename = file_path.stem.lower()
-        filename_without_slide = filename.replace('slide', '')
-        
-        # Exact match
-        normalized_compact = normalized.replace(' ', '')
-        if normalized_compact and (filename_without_slide == normalized_compact or filename == normalized_compact):
-            return f"src/pages/slides/{file_path.name}"
-        
-        # Keyword matching with scoring
-        score = sum(len(keyword) for keyword in keywords if keyword in filename)
-        
-        # Check common slide name patterns
-        if keywords:
-            title_pattern = ''.join(w.capitalize() for w in keywords)
-            if title_pattern.lower() in filename:
-                score += len(title_pattern) * 2
+    return score
+
+
+def resolve_slide_files(slide_titles: Iterable[str], slides_dir: Path) -> Dict[str, str]:
+    """
+    Map slide titles to slide file paths
+    RegisterSlide titles are looked up in the cached index; the remaining titles
+    are keyword-matched against file names together in a single pass
+    """
+    if not slides_dir.exists():
+        return {}
+    
+    title_index, stems = _load_slide_files(slides_dir)
+    resolved = {title: title_index[title] for title in slide_titles if title in title_index}
+    
+    # Fallback: extract English part of each unmatched title and score file names
+    pending = {}
+    for title in slide_titles:
+        if title not in title_index and title not in pending:
+            normalized_compact, keywords = _title_keywords(title)
+            if keywords:
+                pending[title] = (normalized_compact, keywords, [0, None])
+    
+    if pending:
+        for name, filename in stems:
+            for normalized_compact, keywords, best in pending.values():
+                score = _keyword_score(filename, normalized_compact, keywords)
+                if score > best[0]:
+                    best[0], best[1] = score, name
         
-        if score > best_score:
-            best_score = score
-            best_match = file_path.name
+        for title, (_, _, (best_score, best_match)) in pending.items():
+            if best_match and best_score > 0:
+                resolved[title] = best_match
     
-    return f"src/pages/slides/{best_match}" if best_match and best_score > 0 else None
+    return {title: f"src/pages/slides/{name}" for title, name in resolved.items()}
 
 
-def generate_fix_suggestions(violation: Dict) -> Dict:
-    """Generate fix suggestions based on violation type"""
-    v_type = violation.get('type')
-    message = violation.get('message', '')
-    overflow_amount = violation.get('overflowAmount', 0)
-    actual = violation.get('actual', 0)
-    expected = violation.get('expected', 0)
-    
-    strategies = {
-        'CONTAINER_OVERFLOW': {
-            'priority': 'HIGH',
-            'fixSuggestions': [
+@lru_cache(maxsize=16)
+def _suggestion_skeleton(v_type: Optional[str]) -> Tuple[Tuple[Dict, Tuple[str, ...]], ...]:
+    """
+    Build the static fix strategies for a violation type once
+    Each strategy comes with the keys whose values are str.format templates
+    filled in from the violation's numbers
+    """
+    if v_type == 'CONTAINER_OVERFLOW':
+        return (
+            (
                 {
                     'strategy': 'Remove overflow:hidden',
                     'description': 'Change parent container from overflow:hidden to allow content to show',
                     'codePattern': 'overflow-hidden',
                     'suggestedChange': 'Remove overflow-hidden class OR change to overflow-auto',
                     'risk': 'LOW',
-                    'estimatedFix': f'Will reveal {round(overflow_amount)}px of hidden content',
+                    'estimatedFix': 'Will reveal {overflow}px of hidden content',
                 },
+                ('estimatedFix',),
+            ),
+            (
                 {
                     'strategy': 'Reduce content',
-                    'description': f'Remove ~{round(overflow_amount)}px worth of content',
+                    'description': 'Remove ~{overflow}px worth of content',
                     'suggestedChange': 'Remove 1-2 cards, reduce padding/gaps, or shorten text',
                     'risk': 'MEDIUM',
-                    'estimatedFix': f'Need to save {round(overflow_amount)}px',
+                    'estimatedFix': 'Need to save {overflow}px',
                 },
-            ],
-        },
-        'VERTICAL_OVERFLOW': {
-            'priority': 'HIGH' if 'compressed' in message or 'squeezed' in message else 'MEDIUM',
-            'fixSuggestions': [
+                ('description', 'estimatedFix'),
+            ),
+        )
+    if v_type == 'VERTICAL_OVERFLOW':
+        return (
+            (
                 {
                     'strategy': 'Optimize content density',
                     'description': 'Adjust content to fill available space without compression',
-                    'suggestedChange': f'Card needs {round(actual)}px but only gets {round(expected)}px',
+                    'suggestedChange': 'Card needs {actual}px but only gets {expected}px',
                     'risk': 'LOW',
-                    'estimatedFix': f'Need to save {round(overflow_amount)}px or expand container',
+                    'estimatedFix': 'Need to save {overflow}px or expand container',
                 },
-            ],
-        },
-        'BODY_OVERFLOW': {
-            'priority': 'CRITICAL',
-            'fixSuggestions': [
+                ('suggestedChange', 'estimatedFix'),
+            ),
+        )
+    if v_type == 'BODY_OVERFLOW':
+        return (
+            (
                 {
                     'strategy': 'Remove content blocks',
                     'description': 'Primary solution: delete entire cards/sections',
-                    'suggestedChange': f'Remove 1-2 card blocks (saves ~170px each)',
+                    'suggestedChange': 'Remove 1-2 card blocks (saves ~170px each)',
                     'risk': 'MEDIUM',
-                    'estimatedFix': f'Need to save {round(overflow_amount)}px total',
+                    'estimatedFix': 'Need to save {overflow}px total',
                 },
+                ('estimatedFix',),
+            ),
+            (
                 {
                     'strategy': 'Reduce spacing',
                     'description': 'Compact the layout',
                     'suggestedChange': 'Reduce: gap-8→gap-4, p-8→p-6, space-y-8→space-y-4',
                     'risk': 'MEDIUM',
-                    'estimatedFix': f'Save 8-16px per change (need {round(overflow_amount / 12)} changes)',
+                    'estimatedFix': 'Save 8-16px per change (need {changes} changes)',
                 },
-            ],
-        },
-    }
-    
-    return strategies.get(v_type, {
-        'priority': 'MEDIUM',
-        'fixSuggestions': [
+                ('estimatedFix',),
+            ),
+        )
+    return (
+        (
             {
                 'strategy': 'Manual review',
-                'description': message,
+                'description': '{message}',
                 'suggestedChange': 'Review the violation and adjust accordingly',
                 'risk': 'UNKNOWN',
-            }
-        ],
-    })
+            },
+            ('description',),
+        ),
+    )
 
 
-def enhance_report_for_ai_editor(report: Dict, project_dir: Path) -> Dict:
-    """Enhance overflow report with AI-friendly information"""
-    if not report or 'reports' not in report:
-        return report
+def generate_fix_suggestions(violation: Dict) -> Dict:
+    """Generate fix suggestions based on violation type"""
+    v_type = violation.get('type')
+    message = violation.get('message', '')
+    overflow_amount = violation.get('overflowAmount', 0)
+    
+    if v_type == 'CONTAINER_OVERFLOW':
+        priority = 'HIGH'
+    elif v_type == 'VERTICAL_OVERFLOW':
+        priority = 'HIGH' if 'compressed' in message or 'squeezed' in message else 'MEDIUM'
+    elif v_type == 'BODY_OVERFLOW':
+        priority = 'CRITICAL'
+    else:
+        priority = 'MEDIUM'
+    
+    fields = {
+        'overflow': round(overflow_amount),
+        'actual': round(violation.get('actual', 0)),
+        'expected': round(violation.get('expected', 0)),
+        'changes': round(overflow_amount / 12),
+        'message': message,
+    }
+    
+    fix_suggestions = []
+    for template, dynamic_keys in _suggestion_skeleton(v_type):
+        suggestion = dict(template)
+        for key in dynamic_keys:
+            suggestion[key] = template[key].format(**fields)
+        fix_suggestions.append(suggestion)
+    
+    return {
+        'priority': priority,
+        'fixSuggestions': fix_suggestions,
+    }
+
+
+def enhance_report_for_ai_editor(report: Dict, project_dir: Path) -> Iterator[Dict]:
+    """Enhance each slide report with AI-friendly information, one slide at a time"""
+    # Resolve all slide files up front from the cached slide index
+    slides_dir = project_dir / "src" / "pages" / "slides"
+    slide_files = resolve_slide_files([r['slideTitle'] for r in report['reports']], slides_dir)
     
-    enhanced_reports = []
     for slide_report in report['reports']:
         # Find the slide file
-        slide_file = find_slide_file(slide_report['slideTitle'], project_dir)
+        slide_file = slide_files.get(slide_report['slideTitle'])
         
         # Group violations by type
-        violations_by_type = {}
+        violations_by_type = defaultdict(list)
         for violation in slide_report.get('violations', []):
-            v_type = violation['type']
-            if v_type not in violations_by_type:
-                violations_by_type[v_type] = []
-            violations_by_type[v_type].append(violation)
+            violations_by_type[violation['type']].append(violation)
         
-        # Generate fix suggestions
+        # Generate fix suggestions, tracking the highest priority as we go
         fix_suggestions = {}
+        highest_priority = 'MEDIUM'
+        best_priority_rank = None
         for v_type, violations in violations_by_type.items():
             first_violation = violations[0]
             suggestions = generate_fix_suggestions(first_violation)
+            priority = suggestions['priority']
+            priority_rank = PRIORITY_ORDER.get(priority, 999)
+            if best_priority_rank is None or priority_rank < best_priority_rank:
+                best_priority_rank = priority_rank
+                highest_priority = priority
+            affected = [v.get('elementInfo') or v.get('element') for v in violations[:3]]
             fix_suggestions[v_type] = {
                 'count': len(violations),
                 'priority': suggestions['priority'],
                 'strategies': suggestions['fixSuggestions'],
-                'affectedElements': [v.get('elementInfo') or v.get('element') for v in violations[:3] if v.get('elementInfo') or v.get('element')],
+                'affectedElements': [element for element in affected if element],
             }
         
-        # Determine highest priority
-        priority_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        highest_priority = min(
-            (suggestions.get('priority', 'MEDIUM') for suggestions in fix_suggestions.values()),
-            key=lambda p: priority_order.get(p, 999),
-            default='MEDIUM'
-        )
+        first_suggestion = next(iter(fix_suggestions.values()), None)
+        recommended_action = first_suggestion['strategies'][0]['strategy'] if first_suggestion else 'Review manually'
         
-        enhanced_reports.append({
+        yield {
             **slide_report,
             'slideFile': slide_file or 'Unknown - check src/pages/slides/',
             'fixSuggestions': fix_suggestions,
             'aiEditorNotes': {
                 'totalIssues': len(slide_report.get('violations', [])),
                 'highestPriority': highest_priority,
-                'recommendedAction': list(fix_suggestions.values())[0]['strategies'][0]['strategy'] if fix_suggestions else 'Review manually',
+                'recommendedAction': recommended_action,
             },
-        })
+        }
+
+
+async def start_browser(browser: Browser) -> None:
+    """
+    Start the Browser service with Chromium flags tuned for overflow detection
+    Browser.start() has no way to pass launch args, so its playwright handles are
+    filled in directly; start() is used as-is when the wrapper lacks those fields
+    """
+    fields = getattr(type(browser), 'model_fields', {})
+    if not {'playwright', 'browser_instance', 'browser_ctx', 'page'} <= fields.keys():
+        await browser.start()
+        return
     
-    return {
-        **report,
-        'reports': enhanced_reports,
-        'aiEditorInstructions': {
-            'workflow': [
-                '1. Read this file to understand all overflow issues',
-                '2. For each slide report, check the slideFile path',
-                '3. Read the slide file',
-                '4. Review fixSuggestions for each violation type',
-                '5. Apply the lowest-risk fix strategy first',
-                '6. Re-run: pnpm run check-overflow to verify',
-                '7. Iterate until totalViolations === 0',
-            ],
-            'priorityOrder': 'CRITICAL → HIGH → MEDIUM → LOW',
-            'maxIterations': 3,
-            'criticalNote': 'ALWAYS fix CRITICAL and HIGH priority issues. Use card removal first (saves most space).',
-        },
-    }
+    # Only hand the handles to the Browser once fully started, so a failed or
+    # cancelled launch is torn down here and never reaches browser.stop()
+    playwright = await async_playwright().start()
+    try:
+        browser_instance = await playwright.chromium.launch(
+            headless=browser.headless,
+            proxy=getattr(browser, 'proxy', None),
+            args=_CHROMIUM_ARGS,
+        )
+        browser_ctx = await browser_instance.new_context()
+        page = await browser_ctx.new_page()
+    except BaseException:
+        with suppress(Exception):
+            await playwright.stop()
+        raise
+    
+    browser.playwright = playwright
+    browser.browser_instance = browser_instance
+    browser.browser_ctx = browser_ctx
+    browser.page = page
+
+
+async def abort_request(route) -> None:
+    """Abort a routed request"""
+    await route.abort()
+
+
+def _dumps(value, depth: int) -> bytes:
+    """Encode a value as 2-space indented JSON nested ``depth`` levels deep"""
+    if orjson is not None:
+        encoded = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+    return encoded.replace(b'\n', b'\n' + b'  ' * depth)
+
+
+def write_report(report: Dict, output_path: Path) -> None:
+    """
+    Write the report as indented JSON through a single buffered binary sink
+    Top-level values that are iterators (e.g. lazily enhanced slide reports) are
+    streamed item by item, so only one item is encoded in memory at a time.
+    Output goes to a temp file that replaces output_path only once fully written,
+    so a failure mid-stream leaves the previous report intact
+    """
+    tmp_path = output_path.with_name(f'.{output_path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(b'{')
+            for i, (key, value) in enumerate(report.items()):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(_dumps(key, 1) + b': ')
+                if not isinstance(value, Iterator):
+                    f.write(_dumps(value, 1))
+                    continue
+                
+                empty = True
+                for item in value:
+                    f.write(b'[\n    ' if empty else b',\n    ')
+                    f.write(_dumps(item, 2))
+                    empty = False
+                f.write(b'[]' if empty else b'\n  ]')
+            f.write(b'\n}' if report else b'}')
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+def print_violations(reports: Iterable[Dict]) -> Iterator[Dict]:
+    """Print each slide's violations as its report passes through"""
+    for report in reports:
+        if report.get('violations'):
+            print(f'\n   Slide {report["slideIndex"] + 1}: {report["slideTitle"]}')
+            if report.get('slideFile'):
+                print(f'      File: {report["slideFile"]}')
+            for v in report['violations']:
+                print(f'      - [{v["type"]}] {v["message"]}')
+        yield report
 
 
-async def collect_overflow_reports(project_dir: Path) -> Dict:
-    """Main function to collect overflow reports"""
+async def wait_for_vite_url(vite_process: asyncio.subprocess.Process) -> Optional[str]:
+    """Echo Vite output until the server prints its local URL"""
+    async for raw_line in vite_process.stdout:
+        line = raw_line.decode('utf-8', errors='replace')
+        print(f'   {line.rstrip()}')
+        match = re.search(r'http://localhost:(\d+)', line)
+        if match:
+            return f'http://localhost:{match.group(1)}'
+    
+    # stdout closed before a URL was printed: the server exited
+    raise Exception('Vite server failed to start')
+
+
+async def drain_stream(stream: asyncio.StreamReader) -> None:
+    """Discard remaining output from a subprocess pipe"""
+    while await stream.read(65536):
+        pass
+
+
+async def collect_overflow_reports(project_dir: Path, dev: bool = False) -> Dict:
+    """
+    Main function to collect overflow reports
+    Serves the built app with `vite preview` by default; pass dev=True to run the
+    dev server against unbuilt sources instead.
+    Slide reports are streamed to check_overflow.json rather than kept in memory,
+    so the returned dict holds the summary fields without 'reports'
+    """
     print('🚀 Starting automatic overflow detection...')
     print(f'   Project: {project_dir}\n')
     
-    # Start Vite dev server
-    print('📦 Starting Vite dev server...')
-    vite_process = subprocess.Popen(
-        ['pnpm', 'dev', '--port', '0'],
-        cwd=project_dir,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+    if dev:
+        print('📦 Starting Vite dev server...')
+        command = ['pnpm', 'dev', '--port', '0']
+        default_url = 'http://localhost:5173'
+    else:
+        print('📦 Starting Vite preview server...')
+        command = ['pnpm', 'exec', 'vite', 'preview', '--port', str(_PREVIEW_PORT), '--strictPort']
+        default_url = f'http://localhost:{_PREVIEW_PORT}'
+    
+    vite_process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=str(project_dir),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
     )
     
-    # Extract port from output
-    preview_url = None
+    browser_task = None
+    drain_task = None
     try:
-        for line in vite_process.stdout:
-            print(f'   {line.rstrip()}')
-            match = re.search(r'http://localhost:(\d+)', line)
-            if match:
-                preview_url = f'http://localhost:{match.group(1)}'
-                break
-            # Timeout after 30 seconds
-            if vite_process.poll() is not None:
-                raise Exception('Vite server failed to start')
+        # Launch headless browser using server's Browser service while Vite is still bundling
+        print('🌐 Launching headless browser...')
+        browser = Browser(headless=True)
+        browser_task = asyncio.create_task(start_browser(browser))
+        
+        # Wait for the server to print its URL (the dev server picks a random port)
+        try:
+            preview_url = await asyncio.wait_for(wait_for_vite_url(vite_process), timeout=30)
+        except asyncio.TimeoutError:
+            preview_url = None
         
         if not preview_url:
             # Wait a bit more
             await asyncio.sleep(5)
-            preview_url = 'http://localhost:5173'
+            preview_url = default_url
+        
+        # Keep reading Vite output so the pipe never fills up and stalls the server
+        drain_task = asyncio.create_task(drain_stream(vite_process.stdout))
         
         print(f'✅ Server started at: {preview_url}\n')
         
-        # Launch headless browser using server's Browser service
-        print('🌐 Launching headless browser...')
-        browser = Browser(headless=True)
-        await browser.start()
+        await browser_task
+        
+        # Navigate to the presentation
+        print('📄 Loading presentation...')
+        await browser.page.add_init_script(_PAGE_HELPERS_SCRIPT)
+        await browser.page.route(_BLOCKED_URL_RE, abort_request)
+        await browser.goto(preview_url, timeout=60000)
         
+        # Wait for React to initialize
+        await asyncio.sleep(3)
+
+        # Wait for all images (including CDN URLs) to load
+        print('🖼️  Waiting for all images to load...')
         try:
-            # Navigate to the presentation
-            print('📄 Loading presentation...')
-            await browser.goto(preview_url, timeout=60000)
-            
-            # Wait for React to initialize
-            await asyncio.sleep(3)
+            await browser.page.wait_for_function('window.__imagesReady()', timeout=10000)
+        except Exception as e:
+            logger.warning(f'Some images failed to load: {e}')
+        await asyncio.sleep(1)
 
-            # Wait for all images (including CDN URLs) to load
-            print('🖼️  Waiting for all images to load...')
-            try:
-                await browser.page.wait_for_function(
-                    '''() => {
-                        const images = Array.from(document.images);
-                        return images.every(img => img.complete);
-                    }''',
-                    timeout=10000
-                )
-            except Exception as e:
-                logger.warning(f'Some images failed to load: {e}')
-            await asyncio.sleep(1)
-
-            # Get total slides
+        # Get total slides
+        slide_count = await browser.page.evaluate('''
+            () => {
+                const slides = window.__allSlides || [];
+                return slides.length;
+            }
+        ''')
+        
+        if slide_count == 0:
+            print('⚠️  Could not detect slides, waiting longer...')
+            await asyncio.sleep(3)
             slide_count = await browser.page.evaluate('''
                 () => {
                     const slides = window.__allSlides || [];
                     return slides.length;
                 }
             ''')
+        
+        print(f'📊 Total slides: {slide_count}\n')
+        
+        if slide_count == 0:
+            raise Exception('No slides detected in presentation')
+        
+        # Navigate through all slides inside the page with a single evaluate call
+        print(f'🔄 Navigating through {slide_count} slides to trigger detection...')
+        collected = await browser.page.evaluate(
+            '(timing) => window.__collectAll(timing)',
+            {'readyTimeoutMs': _SLIDE_READY_TIMEOUT_MS},
+        )
+        for i in collected['failed']:
+            print(f'   ⚠️  Could not navigate to slide {i + 1}')
+        overflow_summary = collected['summary']
+        
+        # Enhance report
+        if not overflow_summary:
+            final_report = {
+                'generatedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'totalSlides': slide_count,
+                'slidesWithIssues': 0,
+                'totalViolations': 0,
+                'reports': [],
+                'aiEditorInstructions': {
+                    'message': 'No overflow issues detected! All slides fit within bounds.',
+                },
+            }
+        elif 'reports' not in overflow_summary:
+            final_report = overflow_summary
+        else:
+            # Slide reports are enhanced lazily and streamed straight to disk
+            final_report = {
+                **overflow_summary,
+                'reports': enhance_report_for_ai_editor(overflow_summary, project_dir),
+                'aiEditorInstructions': AI_EDITOR_INSTRUCTIONS,
+            }
+        
+        # Print summary
+        if final_report['totalViolations'] == 0:
+            print('\n✅ No overflow issues detected!')
+        else:
+            print('\n📋 Summary:')
+            print(f'   Total Slides: {final_report["totalSlides"]}')
+            print(f'   Slides with Issues: {final_report["slidesWithIssues"]}')
+            print(f'   Total Violations: {final_report["totalViolations"]}')
             
-            if slide_count == 0:
-                print('⚠️  Could not detect slides, waiting longer...')
-                await asyncio.sleep(3)
-                slide_count = await browser.page.evaluate('''
-                    () => {
-                        const slides = window.__allSlides || [];
-                        return slides.length;
-                    }
-                ''')
-            
-            print(f'📊 Total slides: {slide_count}\n')
-            
-            if slide_count == 0:
-                raise Exception('No slides detected in presentation')
-            
-            # Navigate through all slides
-            print('🔄 Navigating through slides to trigger detection...')
-            for i in range(slide_count):
-                print(f'   Slide {i + 1}/{slide_count}')
-                
-                if i > 0:
-                    # Use the exposed __navigateToSlide function
-                    navigated = await browser.page.evaluate(f'''
-                        (slideIndex) => {{
-                            if (typeof window.__navigateToSlide === 'function') {{
-                                return window.__navigateToSlide(slideIndex);
-                            }}
-                            return false;
-                        }}
-                    ''', i)
-                    
-                    if not navigated:
-                        print(f'   ⚠️  Could not navigate to slide {i + 1}')
-
-                    # Wait for images to load on this slide
+            print('\n🚨 Violations found:')
+            final_report = {**final_report, 'reports': print_violations(final_report['reports'])}
+        
+        # Save to file (violations are printed as each slide report is written)
+        output_path = project_dir / 'check_overflow.json'
+        write_report(final_report, output_path)
+        
+        print(f'\n💾 Report saved to: {output_path}')
+        
+        # Slide reports were consumed while streaming; return the summary fields
+        return {key: value for key, value in final_report.items() if key != 'reports'}
+
+    finally:
+        try:
+            # The browser may have started even if Vite failed
+            if browser_task is not None:
+                if not browser_task.done():
+                    browser_task.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await browser_task
+                if getattr(browser, 'playwright', None) is not None:
+                    # A failing stop must not mask the original error or skip Vite cleanup
                     try:
-                        await browser.page.wait_for_function(
-                            '''() => {
-                                const images = Array.from(document.images);
-                                return images.every(img => img.complete);
-                            }''',
-                            timeout=3000
-                        )
-                    except Exception:
-                        pass  # Continue even if timeout
-                    await asyncio.sleep(0.8)
-                else:
-                    await asyncio.sleep(1)
-            
-            # Wait for final detection
-            print('\n⏳ Waiting for final detection to complete...')
-            await asyncio.sleep(2)
-            
-            # Generate summary
-            print('📥 Generating final overflow summary...')
-            overflow_summary = await browser.page.evaluate('''
-                () => {
-                    if (typeof window.__generateOverflowSummary === 'function') {
-                        return window.__generateOverflowSummary();
-                    }
-                    return window.__overflowSummary;
-                }
-            ''')
-            
-            # Enhance report
-            if not overflow_summary:
-                final_report = {
-                    'generatedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
-                    'totalSlides': slide_count,
-                    'slidesWithIssues': 0,
-                    'totalViolations': 0,
-                    'reports': [],
-                    'aiEditorInstructions': {
-                        'message': 'No overflow issues detected! All slides fit within bounds.',
-                    },
-                }
-            else:
-                final_report = enhance_report_for_ai_editor(overflow_summary, project_dir)
-            
-            # Save to file
-            output_path = project_dir / 'check_overflow.json'
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(final_report, f, indent=2, ensure_ascii=False)
-            
-            # Print summary
-            if final_report['totalViolations'] == 0:
-                print('\n✅ No overflow issues detected!')
-            else:
-                print('\n📋 Summary:')
-                print(f'   Total Slides: {final_report["totalSlides"]}')
-                print(f'   Slides with Issues: {final_report["slidesWithIssues"]}')
-                print(f'   Total Violations: {final_report["totalViolations"]}')
-                
-                print('\n🚨 Violations found:')
-                for report in final_report['reports']:
-                    if report.get('violations'):
-                        print(f'\n   Slide {report["slideIndex"] + 1}: {report["slideTitle"]}')
-                        if report.get('slideFile'):
-                            print(f'      File: {report["slideFile"]}')
-                        for v in report['violations']:
-                            print(f'      - [{v["type"]}] {v["message"]}')
-            
-            print(f'\n💾 Report saved to: {output_path}')
-            
-            return final_report
-            
+                        await browser.stop()
+                    except Exception as e:
+                        logger.warning(f'Failed to stop browser: {e}')
+                    else:
+                        print('\n🧹 Cleanup completed')
         finally:
-            await browser.stop()
-            print('\n🧹 Cleanup completed')
-    
-    finally:
-        # Cleanup Vite process
-        if vite_process:
-            vite_process.terminate()
-            try:
-                vite_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                vite_process.kill()
+            # Cleanup Vite process
+            if vite_process.returncode is None:
+                vite_process.terminate()
+                try:
+                    await asyncio.wait_for(vite_process.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    vite_process.kill()
+                    await vite_process.wait()
+            if drain_task is not None:
+                drain_task.cancel()
 
 
 def main():
     """Main entry point"""
-    project_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
+    parser = argparse.ArgumentParser(description='Collect overflow reports for the presentation')
+    parser.add_argument('project_dir', nargs='?', type=Path, default=Path.cwd())
+    parser.add_argument('--dev', action='store_true', help='use the Vite dev server instead of previewing the build')
+    args = parser.parse_args()
     
     try:
-        result = asyncio.run(collect_overflow_reports(project_dir))
+        result = asyncio.run(collect_overflow_reports(args.project_dir, dev=args.dev))
         print('\n✨ Done!')
         sys.exit(0)
     except Exception as e:
@@ -38,6 +38,8 @@ interface OverflowDetectorProps {
   enableConsoleWarnings?: boolean;
   /** Export errors as JSON for external tooling */
   onExportJSON?: (json: string) => void;
+  /** Called after every completed detection pass, with or without violations */
+  onDetectionComplete?: () => void;
   /** CSS class to force ignore elements (e.g., 'od-ignore' for decorations) */
   ignoreClass?: string;
   /** CSS class to force check elements (e.g., 'od-block' for content) */
@@ -131,6 +133,7 @@ export const OverflowDetector: React.FC<OverflowDetectorProps> = ({
   onOverflowDetected,
   enableConsoleWarnings = true,
   onExportJSON,
+  onDetectionComplete,
   ignoreClass = 'od-ignore',
   forceCheckClass = 'od-block',
   useResizeObserver = false,
@@ -753,6 +756,8 @@ export const OverflowDetector: React.FC<OverflowDetectorProps> = ({
       } else if (enableConsoleWarnings) {
         console.log(`✅ Overflow Detection: No issues found (${slideWidth}×${slideHeight}px)`);
       }
+
+      onDetectionComplete?.();
     };
 
     // Helper function to check if all images are loaded
@@ -825,7 +830,7 @@ export const OverflowDetector: React.FC<OverflowDetectorProps> = ({
       const timer = setTimeout(detectWithImageCheck, 100);
       return () => clearTimeout(timer);
     }
-  }, [children, slideWidth, slideHeight, minBottomMargin, minTopMargin, onOverflowDetected, enableConsoleWarnings, onExportJSON, ignoreClass, forceCheckClass, useResizeObserver, verticalTolerance, horizontalTolerance, marginTolerance, debounceMs, containerMismatchTolerance, enableHeightAnalysis, detectionMode]);
+  }, [children, slideWidth, slideHeight, minBottomMargin, minTopMargin, onOverflowDetected, enableConsoleWarnings, onExportJSON, onDetectionComplete, ignoreClass, forceCheckClass, useResizeObserver, verticalTolerance, horizontalTolerance, marginTolerance, debounceMs, containerMismatchTolerance, enableHeightAnalysis, detectionMode]);
 
   return (
     <div 
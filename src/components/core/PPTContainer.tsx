@@ -47,6 +47,7 @@ declare global {
     __overflowSummary?: OverflowSummary;
     __generateOverflowSummary?: () => OverflowSummary;
     __navigateToSlide?: (index: number) => boolean;
+    __detectedSlides?: Set<number>;
   }
 }
 
@@ -71,6 +72,8 @@ interface PPTContainerProps {
   exportProgress?: { current: number; total: number } | null;
   /** Whether to enable slide animations (true only in full-screen preview). */
   enableAnimations?: boolean;
+  /** Record finished overflow-detection passes in window.__detectedSlides (enable on the on-screen container only). */
+  publishDetectionProgress?: boolean;
 }
 
 export const PPTContainer: React.FC<PPTContainerProps> = ({
@@ -83,6 +86,7 @@ export const PPTContainer: React.FC<PPTContainerProps> = ({
   isExporting,
   exportProgress,
   enableAnimations,
+  publishDetectionProgress,
 }) => {
   const isFullScreen = useAppStore((s) => s.isFullScreen);
   const setAnimationEnabled = useAppStore((s) => s.setAnimationEnabled);
@@ -188,6 +192,14 @@ export const PPTContainer: React.FC<PPTContainerProps> = ({
     allReportsRef.current.set(slideId, enhancedData);
   }, [slides, displayedSlideIndex]);
   
+  // Record which slides have finished detection so automated tools can wait on them
+  const handleDetectionComplete = useCallback(() => {
+    if (typeof window !== 'undefined') {
+      window.__detectedSlides = window.__detectedSlides ?? new Set<number>();
+      window.__detectedSlides.add(displayedSlideIndex);
+    }
+  }, [displayedSlideIndex]);
+  
   // Expose function to manually trigger summary generation (for automated testing)
   useEffect(() => {
     if (typeof window !== 'undefined') {
@@ -387,6 +399,7 @@ export const PPTContainer: React.FC<PPTContainerProps> = ({
                   enableConsoleWarnings={true}
                   useResizeObserver={true}
                   onExportJSON={handleOverflowExport}
+                  onDetectionComplete={publishDetectionProgress ? handleDetectionComplete : undefined}
                 >
                   {React.createElement(currentSlide.component)}
                 </OverflowDetector>
@@ -402,6 +415,7 @@ export const PPTContainer: React.FC<PPTContainerProps> = ({
                 enableConsoleWarnings={true}
                 useResizeObserver={true}
                 onExportJSON={handleOverflowExport}
+                onDetectionComplete={publishDetectionProgress ? handleDetectionComplete : undefined}
               >
                 {React.createElement(currentSlide.component)}
               </OverflowDetector>
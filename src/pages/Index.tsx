@@ -219,6 +219,7 @@ export default function Page() {
                   isExporting={isExporting}
                   exportProgress={exportProgress}
                   enableAnimations={false}
+                  publishDetectionProgress
                 />
               </div>
             </PPTPlatformStage>